@@ -3,9 +3,19 @@
 
 from __future__ import absolute_import, print_function
 import logging
+import sys
 
 logger = logging.getLogger("ableton_mcp")
 
+JSONRPC_VERSION = "2.0"
+
+# Cap on memoized method-not-found error bodies (see _method_not_found)
+_MAX_CACHED_ERRORS = 64
+
+# Shared default for requests without params. Handlers must treat params
+# as read-only.
+_EMPTY_PARAMS = {}
+
 # Import handlers
 from .handlers.project import ProjectHandler
 from .handlers.transport import TransportHandler
@@ -21,9 +31,12 @@ class CommandDispatcher:
     Examples: "project.getInfo", "transport.play", "clip.getNotes"
     """
 
+    __slots__ = ('manager', 'song', 'handlers', '_routes',
+                 '_last_method', '_last_route', '_error_bodies')
+
     def __init__(self, manager):
         self.manager = manager
-        self._song = None
+        self.song = None
 
         # Initialize handlers
         self.handlers = {
@@ -33,12 +46,37 @@ class CommandDispatcher:
             'clip': ClipHandler(self),
         }
 
-    @property
-    def song(self):
-        """Lazy access to song to ensure it's available."""
-        if self._song is None:
-            self._song = self.manager.song()
-        return self._song
+        # Flat "category.action" -> (bound method, takes_params) table,
+        # merged from the handlers' method tables so dispatch() is a single
+        # dict lookup per request. Keys are interned to match the interned
+        # incoming method names by identity.
+        self._routes = {}
+        for category, handler in self.handlers.items():
+            for action, route in handler.methods.items():
+                self._routes[sys.intern(category + '.' + action)] = route
+
+        # One-entry inline cache in front of the route table; clients tend
+        # to send bursts of the same method
+        self._last_method = None
+        self._last_route = None
+
+        # Memoized {code, message} bodies for repeated method-not-found errors
+        self._error_bodies = {}
+
+    def _ensure_song(self):
+        """Resolve the song once Live is ready and hand it to all handlers.
+
+        Stored as plain attributes so handler access to self.song is a
+        direct attribute load rather than a property chain.
+        """
+        self.song = self.manager.song()
+        for handler in self.handlers.values():
+            handler.song = self.song
+
+    def disconnect(self):
+        """Release handler resources (Live listeners)."""
+        for handler in self.handlers.values():
+            handler.disconnect()
 
     def dispatch(self, request):
         """
@@ -50,32 +88,44 @@ class CommandDispatcher:
         Returns:
             Dict with jsonrpc, id, result or error
         """
-        request_id = request.get('id')
-        method = request.get('method', '')
-        params = request.get('params', {})
-
-        logger.info("Dispatching: %s", method)
+        try:
+            method = request['method']
+            request_id = request['id']
+        except KeyError:
+            # Notifications and malformed requests
+            method = request.get('method', '')
+            request_id = request.get('id')
+        if type(method) is str:
+            # Interned so the inline cache hit is an identity compare
+            method = sys.intern(method)
+        params = request.get('params') or _EMPTY_PARAMS
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Dispatching: %s", method)
 
         try:
+            if self.song is None:
+                self._ensure_song()
+
             # Special case: ping for connectivity testing
             if method == 'ping':
-                return self._success(request_id, {'pong': True})
-
-            # Parse method as category.action
-            parts = method.split('.', 1)
-            if len(parts) != 2:
-                return self._error(request_id, -32601, "Invalid method format: " + method)
-
-            category, action = parts
-
-            # Find handler
-            handler = self.handlers.get(category)
-            if not handler:
-                return self._error(request_id, -32601, "Unknown category: " + category)
-
-            # Execute handler
-            result = handler.handle(action, params)
-            return self._success(request_id, result)
+                return {"jsonrpc": JSONRPC_VERSION, "id": request_id, "result": {'pong': True}}
+
+            if method is self._last_method:
+                route = self._last_route
+            else:
+                # Lookup kept in its own try so KeyErrors raised inside
+                # handlers still surface as internal errors
+                try:
+                    route = self._routes[method]
+                except KeyError:
+                    return self._unknown_method(request_id, method)
+                self._last_method = method
+                self._last_route = route
+
+            fn, needs_params = route
+            result = fn(params) if needs_params else fn()
+            return {"jsonrpc": JSONRPC_VERSION, "id": request_id, "result": result}
 
         except ValueError as e:
             # Known error (e.g., unknown action)
@@ -86,18 +136,30 @@ class CommandDispatcher:
             logger.error("Dispatch error: %s", e, exc_info=True)
             return self._error(request_id, -32603, str(e))
 
-    def _success(self, request_id, result):
-        """Create a success response."""
-        return {
-            "jsonrpc": "2.0",
-            "id": request_id,
-            "result": result
-        }
+    def _unknown_method(self, request_id, method):
+        """Create the error response for a method with no route."""
+        category, sep, action = method.partition('.')
+        if not sep:
+            return self._method_not_found(request_id, "Invalid method format: " + method)
+
+        if category not in self.handlers:
+            return self._method_not_found(request_id, "Unknown category: " + category)
+
+        return self._error(request_id, -32602, "Unknown action: " + action)
+
+    def _method_not_found(self, request_id, message):
+        """Create a -32601 error response, reusing the error body for repeats."""
+        body = self._error_bodies.get(message)
+        if body is None:
+            body = {"code": -32601, "message": message}
+            if len(self._error_bodies) < _MAX_CACHED_ERRORS:
+                self._error_bodies[message] = body
+        return {"jsonrpc": JSONRPC_VERSION, "id": request_id, "error": body}
 
     def _error(self, request_id, code, message):
         """Create an error response."""
         return {
-            "jsonrpc": "2.0",
+            "jsonrpc": JSONRPC_VERSION,
             "id": request_id,
             "error": {
                 "code": code,
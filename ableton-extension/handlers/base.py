@@ -1,48 +1,66 @@
 # Base Handler for Ableton MCP
 
 from __future__ import absolute_import, print_function
+import inspect
 import logging
+import sys
+from contextlib import contextmanager
 
 logger = logging.getLogger("ableton_mcp")
 
 
+def takes_params(method):
+    """Return True if a bound handle_* method accepts the params argument.
+
+    Handlers that never read params may omit it from their signature.
+    """
+    return bool(inspect.signature(method).parameters)
+
+
 class BaseHandler:
     """
     Base class for all Ableton MCP handlers.
 
     Provides common functionality for routing actions and
     accessing the Live API through the dispatcher.
+
+    Handler methods should be named: handle_{action}
+    For example: handle_getInfo, handle_setBpm, handle_play
+    Handlers that don't use params may be declared without it.
+    The dispatcher routes requests through the methods table.
     """
 
+    __slots__ = ('dispatcher', 'song', 'methods')
+
     def __init__(self, dispatcher):
         self.dispatcher = dispatcher
+        # Current Live song/set, assigned by the dispatcher once Live is ready
+        self.song = None
+        # action -> (bound handle_* method, takes_params), built once so
+        # routing never goes through getattr. Keys are interned.
+        self.methods = {}
+        for name in dir(self):
+            if name.startswith('handle_'):
+                method = getattr(self, name)
+                self.methods[sys.intern(name[7:])] = (method, takes_params(method))
 
-    @property
-    def song(self):
-        """Access the current Live song/set."""
-        return self.dispatcher.song
-
-    def handle(self, action, params):
+    @contextmanager
+    def undo_step(self):
         """
-        Route an action to the appropriate handler method.
-
-        Handler methods should be named: handle_{action}
-        For example: handle_getInfo, handle_setBpm, handle_play
+        Group the Live edits made inside the block into a single undo step.
 
-        Args:
-            action: The action name (e.g., "getInfo", "play")
-            params: Dict of parameters from the JSON-RPC request
-
-        Returns:
-            Dict to be returned as the JSON-RPC result
+        Used by handlers that make several Live API edits for one request,
+        so the user can undo them at once.
         """
-        method_name = "handle_" + action
-        method = getattr(self, method_name, None)
-
-        if not method:
-            raise ValueError("Unknown action: " + action)
+        self.song.begin_undo_step()
+        try:
+            yield
+        finally:
+            self.song.end_undo_step()
 
-        return method(params)
+    def disconnect(self):
+        """Release Live listeners. Called when the control surface disconnects."""
+        pass
 
     def success(self):
         """Return a simple success response."""
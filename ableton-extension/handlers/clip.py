@@ -3,6 +3,7 @@
 
 from __future__ import absolute_import, print_function
 import logging
+from itertools import islice
 
 try:
     import Live
@@ -11,8 +12,74 @@ except ImportError:
 
 from .base import BaseHandler
 
+# Bound once so note-building loops skip the Live.Clip attribute lookups
+_MidiNoteSpecification = Live.Clip.MidiNoteSpecification if Live is not None else None
+
 logger = logging.getLogger("ableton_mcp")
 
+# Max distance (in beats) for a note's start time to match a requested x
+NOTE_TIME_TOLERANCE = 0.001
+
+
+def _find_index(items, item, index_map):
+    """
+    Find the index of a Live object in a sequence.
+
+    Looks up id(item) in index_map and verifies the hit with ==. On a miss
+    or stale entry, falls back to the plain == scan (the only reliable
+    comparison for Live proxies), stopping at the first match and
+    remembering the ids of the items scanned so far. A miss therefore
+    costs no more Live calls than the scan alone.
+
+    Returns:
+        Index of item, or None if not found
+    """
+    index = index_map.get(id(item))
+    if index is not None and index < len(items) and items[index] == item:
+        return index
+
+    index_map.clear()
+    for i, candidate in enumerate(items):
+        index_map[id(candidate)] = i
+        if candidate == item:
+            return i
+    return None
+
+
+def _object_note_fields(note):
+    """Normalize an object-format setNotes entry to (x, y, velocity, duration, muted)."""
+    return (note['x'], note['y'], note.get('velocity', 100),
+            note.get('duration', 0.25), note.get('muted', False))
+
+
+def _add_notes(clip, note_fields):
+    """
+    Add notes to a clip in one add_new_notes call.
+
+    The legacy set_notes tuple API would avoid building a spec object per
+    note, but Live 11+ shows a deprecation dialog for it (as for the other
+    pre-extended note calls), so MidiNoteSpecification is always used.
+
+    Args:
+        clip: Live MIDI clip
+        note_fields: Iterable of (x, y, velocity, duration, muted)
+
+    Returns:
+        Number of notes added
+    """
+    notes = tuple([
+        _MidiNoteSpecification(
+            start_time=float(x),
+            duration=float(duration),
+            pitch=int(y),
+            velocity=float(velocity),
+            mute=muted
+        )
+        for x, y, velocity, duration, muted in note_fields
+    ])
+    clip.add_new_notes(notes)
+    return len(notes)
+
 
 class ClipHandler(BaseHandler):
     """
@@ -27,11 +94,62 @@ class ClipHandler(BaseHandler):
         - setNotes: Add multiple MIDI notes (batch)
         - clearAllNotes: Clear all notes from a clip
         - clearNotesAtPitch: Clear notes at a specific MIDI pitch
+        - clearNotesAtPitches: Clear notes at several MIDI pitches
         - getSelection: Get currently selected clip position
         - select: Select a clip by track/slot index
         - hasContent: Check if a slot has a clip
     """
 
+    __slots__ = ('_track_indices', '_slot_indices', '_clip_cache',
+                 '_cached_slots', '_song_listeners')
+
+    def __init__(self, dispatcher):
+        super(ClipHandler, self).__init__(dispatcher)
+        # id(object) -> index maps, see _find_index
+        self._track_indices = {}
+        self._slot_indices = {}
+        # (trackIndex, slotIndex) -> clip, see _get_clip
+        self._clip_cache = {}
+        self._cached_slots = []
+        self._song_listeners = False
+
+    def disconnect(self):
+        """Remove the clip cache listeners."""
+        self._clear_clip_cache()
+        if self._song_listeners:
+            try:
+                self.song.remove_tracks_listener(self._clear_clip_cache)
+                self.song.remove_scenes_listener(self._clear_clip_cache)
+            except Exception as e:
+                logger.warning("Error removing song listeners: %s", e)
+            self._song_listeners = False
+
+    def _clear_clip_cache(self):
+        """Drop all cached clips. Listener for track, scene and slot changes."""
+        self._clip_cache.clear()
+        for slot in self._cached_slots:
+            try:
+                if slot.has_clip_has_listener(self._clear_clip_cache):
+                    slot.remove_has_clip_listener(self._clear_clip_cache)
+            except Exception:
+                pass  # Slot already deleted along with its scene/track
+        del self._cached_slots[:]
+
+    def _cache_clip(self, key, slot, clip):
+        """Cache a clip until its slot, the track list or the scene list changes."""
+        if not self._song_listeners:
+            self.song.add_tracks_listener(self._clear_clip_cache)
+            self.song.add_scenes_listener(self._clear_clip_cache)
+            self._song_listeners = True
+        if not slot.has_clip_has_listener(self._clear_clip_cache):
+            slot.add_has_clip_listener(self._clear_clip_cache)
+            self._cached_slots.append(slot)
+        self._clip_cache[key] = clip
+
+    def _track_index(self, track):
+        """Get the index of a track in the song, or None."""
+        return _find_index(self.song.tracks, track, self._track_indices)
+
     def _get_track(self, params):
         """Get track from params or use selected track."""
         track_index = params.get('trackIndex')
@@ -41,27 +159,41 @@ class ClipHandler(BaseHandler):
         else:
             # Use selected track
             track = self.song.view.selected_track
-            # Find index
-            for i, t in enumerate(self.song.tracks):
-                if t == track:
-                    return track, i
-            raise ValueError("Could not find selected track index")
+            track_index = self._track_index(track)
+            if track_index is None:
+                raise ValueError("Could not find selected track index")
+            return track, track_index
 
     def _get_clip(self, params):
-        """Get clip from params or cursor selection."""
+        """Get clip from params or cursor selection.
+
+        Clips addressed by explicit trackIndex/slotIndex are cached; the
+        cursor selection path always reads the current selection.
+        """
         track_index = params.get('trackIndex')
         slot_index = params.get('slotIndex')
 
         if track_index is not None and slot_index is not None:
+            key = (track_index, slot_index)
+            clip = self._clip_cache.get(key)
+            # A deleted Live object compares equal to None
+            if clip is not None and clip != None:
+                return clip
+
             track = self.song.tracks[track_index]
             slot = track.clip_slots[slot_index]
-        else:
-            # Use selected clip slot
-            track = self.song.view.selected_track
-            slot = self.song.view.highlighted_clip_slot
+            if not slot.has_clip:
+                raise ValueError("No clip in slot")
 
-            if slot is None:
-                raise ValueError("No clip slot selected")
+            clip = slot.clip
+            self._cache_clip(key, slot, clip)
+            return clip
+
+        # Use selected clip slot
+        slot = self.song.view.highlighted_clip_slot
+
+        if slot is None:
+            raise ValueError("No clip slot selected")
 
         if not slot.has_clip:
             raise ValueError("No clip in slot")
@@ -91,27 +223,20 @@ class ClipHandler(BaseHandler):
         logger.info("Listed %d clips on track %d", len(clips), track_index)
         return {'clips': clips}
 
-    def handle_getSelection(self, params):
+    def handle_getSelection(self):
         """Get currently selected clip position."""
-        track = self.song.view.selected_track
-        slot = self.song.view.highlighted_clip_slot
+        view = self.song.view
+        track = view.selected_track
+        slot = view.highlighted_clip_slot
 
-        # Find track index
-        track_index = None
-        for i, t in enumerate(self.song.tracks):
-            if t == track:
-                track_index = i
-                break
+        track_index = self._track_index(track)
 
-        # Find slot index
         slot_index = None
         has_clip = False
         if track and slot:
-            for i, s in enumerate(track.clip_slots):
-                if s == slot:
-                    slot_index = i
-                    has_clip = slot.has_clip
-                    break
+            slot_index = _find_index(track.clip_slots, slot, self._slot_indices)
+            if slot_index is not None:
+                has_clip = slot.has_clip
 
         return {
             'trackIndex': track_index,
@@ -127,37 +252,38 @@ class ClipHandler(BaseHandler):
         Velocity is normalized to 0.0-1.0 like Bitwig.
         """
         clip = self._get_clip(params)
+        length = clip.length
 
         # get_notes(from_time, from_pitch, time_span, pitch_span)
         # Returns tuple of tuples: ((pitch, time, duration, velocity, mute), ...)
         try:
-            notes = clip.get_notes(0.0, 0, clip.length, 128)
-            logger.info("Got %d notes via get_notes (length=%s)", len(notes) if notes else 0, clip.length)
+            notes = clip.get_notes(0.0, 0, length, 128)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Got %d notes via get_notes (length=%s)", len(notes) if notes else 0, length)
         except Exception as e:
             logger.error("Error getting notes: %s", e)
             return {'notes': [], 'count': 0}
 
         if not notes:
-            return {'notes': [], 'count': 0, 'clipLength': float(clip.length)}
+            return {'notes': [], 'count': 0, 'clipLength': float(length)}
 
         # Always return object format - MCP server handles lean transformation
         # Velocity normalized to 0.0-1.0 for consistency with Bitwig
-        note_list = []
-        for note in notes:
-            try:
-                # Tuple format: (pitch, time, duration, velocity, mute)
-                pitch, time, duration, velocity, mute = note
-                note_list.append({
-                    'x': float(time),
-                    'y': int(pitch),
-                    'velocity': float(velocity) / 127.0,  # Normalize to 0.0-1.0
-                    'duration': float(duration),
-                    'isMuted': bool(mute),
-                })
-            except Exception as e:
-                logger.warning("Error reading note: %s (note=%s)", e, note)
+        # Live always returns well-formed tuples, so convert in one pass
+        # Tuple format: (pitch, time, duration, velocity, mute)
+        try:
+            note_list = [{
+                'x': float(time),
+                'y': int(pitch),
+                'velocity': float(velocity) / 127.0,  # Normalize to 0.0-1.0
+                'duration': float(duration),
+                'isMuted': bool(mute),
+            } for pitch, time, duration, velocity, mute in notes]
+        except Exception as e:
+            logger.error("Error reading notes: %s", e)
+            raise
 
-        return {'notes': note_list, 'count': len(note_list), 'clipLength': float(clip.length)}
+        return {'notes': note_list, 'count': len(note_list), 'clipLength': float(length)}
 
     def handle_clearAllNotes(self, params):
         """Clear all notes from a clip."""
@@ -195,6 +321,38 @@ class ClipHandler(BaseHandler):
 
         return self.success()
 
+    def handle_clearNotesAtPitches(self, params):
+        """Clear all notes at several pitches from a clip in as few calls as possible.
+        Contiguous pitches are merged into a single remove_notes_extended range.
+        """
+        clip = self._get_clip(params)
+        pitches = params.get('pitches')
+
+        if pitches is None:
+            raise ValueError("pitches parameter is required")
+
+        # Collapse sorted pitches into (low, high) runs
+        runs = []
+        for pitch in sorted(set(int(p) for p in pitches)):
+            if runs and runs[-1][1] + 1 == pitch:
+                runs[-1][1] = pitch
+            else:
+                runs.append([pitch, pitch])
+
+        try:
+            length = clip.length
+            with self.undo_step():
+                for low, high in runs:
+                    clip.remove_notes_extended(from_pitch=low, pitch_span=high - low + 1,
+                                               from_time=0.0, time_span=length)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Cleared notes at %d pitch(es) in %d range(s)", len(pitches), len(runs))
+        except Exception as e:
+            logger.error("Error clearing notes at pitches %s: %s", pitches, e)
+            raise
+
+        return self.success()
+
     def handle_setNotes(self, params):
         """Set MIDI notes in a clip. Accepts both ultra-lean and object formats."""
         clip = self._get_clip(params)
@@ -206,32 +364,19 @@ class ClipHandler(BaseHandler):
         if Live is None:
             raise ValueError("Live API not available")
 
+        # Batches are homogeneous, so pick the format once from the first note
+        if isinstance(notes_data[0], list):
+            # Ultra-lean format: [x, y, velocity, duration]
+            note_fields = ((x, y, velocity, duration, False)
+                           for x, y, velocity, duration in notes_data)
+        else:
+            # Object format
+            note_fields = map(_object_note_fields, notes_data)
+
         try:
-            notes = []
-            for note in notes_data:
-                if isinstance(note, list):
-                    # Ultra-lean format: [x, y, velocity, duration]
-                    x, y, velocity, duration = note
-                    muted = False
-                else:
-                    # Object format
-                    x = note['x']
-                    y = note['y']
-                    velocity = note.get('velocity', 100)
-                    duration = note.get('duration', 0.25)
-                    muted = note.get('muted', False)
-
-                spec = Live.Clip.MidiNoteSpecification(
-                    start_time=float(x),
-                    duration=float(duration),
-                    pitch=int(y),
-                    velocity=float(velocity),
-                    mute=muted
-                )
-                notes.append(spec)
-
-            clip.add_new_notes(tuple(notes))
-            logger.info("Added %d notes to clip", len(notes))
+            added = _add_notes(clip, note_fields)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Added %d notes to clip", added)
 
         except Exception as e:
             logger.error("Error setting notes: %s", e)
@@ -251,7 +396,6 @@ class ClipHandler(BaseHandler):
             slot = track.clip_slots[slot_index]
         else:
             # Use selected slot
-            track = self.song.view.selected_track
             slot = self.song.view.highlighted_clip_slot
             if slot is None:
                 raise ValueError("No clip slot selected")
@@ -260,12 +404,13 @@ class ClipHandler(BaseHandler):
             raise ValueError("Slot already has a clip")
 
         try:
-            slot.create_clip(float(length))
-            logger.info("Created clip with length %s beats", length)
+            with self.undo_step():
+                slot.create_clip(float(length))
 
-            # Set name if provided
-            if name and slot.has_clip:
-                slot.clip.name = name
+                # Set name if provided
+                if name and slot.has_clip:
+                    slot.clip.name = name
+            logger.info("Created clip with length %s beats", length)
 
         except Exception as e:
             logger.error("Error creating clip: %s", e)
@@ -283,7 +428,6 @@ class ClipHandler(BaseHandler):
             slot = track.clip_slots[slot_index]
         else:
             # Use selected slot
-            track = self.song.view.selected_track
             slot = self.song.view.highlighted_clip_slot
             if slot is None:
                 raise ValueError("No clip slot selected")
@@ -308,40 +452,28 @@ class ClipHandler(BaseHandler):
         if semitones == 0:
             return self.success()
 
-        if Live is None:
-            raise ValueError("Live API not available")
-
         try:
-            # Get all notes using tuple API
-            notes = clip.get_notes(0.0, 0, clip.length, 128)
+            notes = clip.get_notes_extended(from_pitch=0, pitch_span=128,
+                                            from_time=0.0, time_span=clip.length)
 
             if not notes:
                 return self.success()
 
-            # Clear existing notes using extended API
-            clip.remove_notes_extended(from_pitch=0, pitch_span=128,
-                                       from_time=0.0, time_span=clip.length)
-
-            # Add transposed notes
-            new_notes = []
+            # Shift pitches in place; notes leaving the MIDI range are dropped
+            dropped = []
             for note in notes:
-                # Tuple format: (pitch, time, duration, velocity, mute)
-                pitch, time, duration, velocity, mute = note
-                new_pitch = pitch + semitones
-                # Clamp to valid MIDI range
+                new_pitch = note.pitch + semitones
                 if 0 <= new_pitch <= 127:
-                    spec = Live.Clip.MidiNoteSpecification(
-                        start_time=float(time),
-                        duration=float(duration),
-                        pitch=int(new_pitch),
-                        velocity=float(velocity),
-                        mute=bool(mute)
-                    )
-                    new_notes.append(spec)
-
-            if new_notes:
-                clip.add_new_notes(tuple(new_notes))
-            logger.info("Transposed %d notes by %d semitones", len(new_notes), semitones)
+                    note.pitch = int(new_pitch)
+                else:
+                    dropped.append(note.note_id)
+
+            with self.undo_step():
+                clip.apply_note_modifications(notes)
+                if dropped:
+                    clip.remove_notes_by_id(tuple(dropped))
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Transposed %d notes by %d semitones", len(notes) - len(dropped), semitones)
 
         except Exception as e:
             logger.error("Error transposing clip: %s", e)
@@ -360,12 +492,13 @@ class ClipHandler(BaseHandler):
         try:
             track = self.song.tracks[track_index]
             slot = track.clip_slots[slot_index]
+            view = self.song.view
 
             # Select the track first
-            self.song.view.selected_track = track
+            view.selected_track = track
 
             # Then highlight the clip slot
-            self.song.view.highlighted_clip_slot = slot
+            view.highlighted_clip_slot = slot
 
             logger.info("Selected clip at track %d, slot %d", track_index, slot_index)
 
@@ -408,14 +541,7 @@ class ClipHandler(BaseHandler):
         muted = params.get('muted', False)
 
         try:
-            spec = Live.Clip.MidiNoteSpecification(
-                start_time=float(x),
-                duration=float(duration),
-                pitch=int(y),
-                velocity=float(velocity),
-                mute=muted
-            )
-            clip.add_new_notes((spec,))
+            _add_notes(clip, ((x, y, velocity, duration, muted),))
             logger.info("Added note at x=%s, y=%s", x, y)
 
         except Exception as e:
@@ -434,7 +560,6 @@ class ClipHandler(BaseHandler):
             slot = track.clip_slots[slot_index]
         else:
             # Use selected slot
-            track = self.song.view.selected_track
             slot = self.song.view.highlighted_clip_slot
             if slot is None:
                 raise ValueError("No clip slot selected")
@@ -456,20 +581,19 @@ class ClipHandler(BaseHandler):
 
         if track_index is None:
             track = self.song.view.selected_track
-            # Find track index
-            for i, t in enumerate(self.song.tracks):
-                if t == track:
-                    track_index = i
-                    break
+            track_index = self._track_index(track)
         else:
             track = self.song.tracks[track_index]
 
         # Get scene count (actual project scenes, not max possible)
         scene_count = len(self.song.scenes)
 
+        # Fetch the slot list once; indexing track.clip_slots per iteration
+        # re-reads it through the Live API every time
+        slots = track.clip_slots
         empty_slots = []
-        for i in range(start_from, min(len(track.clip_slots), scene_count)):
-            if not track.clip_slots[i].has_clip:
+        for i, slot in enumerate(islice(slots, start_from, scene_count), start_from):
+            if not slot.has_clip:
                 empty_slots.append(i)
                 if len(empty_slots) >= count:
                     break
@@ -512,6 +636,28 @@ class ClipHandler(BaseHandler):
 
         return self.success()
 
+    def _notes_at(self, clip, x, y):
+        """
+        Find notes starting at step x with pitch y.
+
+        Returns:
+            Tuple of (MidiNoteVector from get_notes_extended, list of
+            matching notes within that vector)
+        """
+        x = float(x)
+        y = int(y)
+        if not 0 <= y <= 127 or x + NOTE_TIME_TOLERANCE <= 0:
+            return (), []
+
+        # Query only the tolerance window around (x, y), not the whole clip
+        from_time = max(0.0, x - NOTE_TIME_TOLERANCE)
+        notes = clip.get_notes_extended(from_pitch=y, pitch_span=1, from_time=from_time,
+                                        time_span=x + NOTE_TIME_TOLERANCE - from_time)
+        # Match by position (within small tolerance) and pitch
+        matches = [note for note in notes
+                   if abs(note.start_time - x) < NOTE_TIME_TOLERANCE and note.pitch == y]
+        return notes, matches
+
     def handle_clearNote(self, params):
         """Remove a single note at position x, y."""
         clip = self._get_clip(params)
@@ -521,42 +667,14 @@ class ClipHandler(BaseHandler):
         if x is None or y is None:
             raise ValueError("x and y are required")
 
-        if Live is None:
-            raise ValueError("Live API not available")
-
         try:
-            # Get all notes
-            notes = clip.get_notes(0.0, 0, clip.length, 128)
+            notes, matches = self._notes_at(clip, x, y)
 
-            # Filter out the target note (match by position and pitch)
-            new_notes = []
-            removed = False
-            for note in notes:
-                pitch, time, duration, velocity, mute = note
-                # Check if this is the note to remove (within small tolerance)
-                if abs(time - float(x)) < 0.001 and int(pitch) == int(y):
-                    removed = True
-                    continue
-                # Keep this note
-                spec = Live.Clip.MidiNoteSpecification(
-                    start_time=float(time),
-                    duration=float(duration),
-                    pitch=int(pitch),
-                    velocity=float(velocity),
-                    mute=bool(mute)
-                )
-                new_notes.append(spec)
-
-            if not removed:
+            if not matches:
                 logger.warning("Note not found at x=%s, y=%s", x, y)
                 return self.success()
 
-            # Clear and rewrite
-            clip.remove_notes_extended(from_pitch=0, pitch_span=128,
-                                       from_time=0.0, time_span=clip.length)
-            if new_notes:
-                clip.add_new_notes(tuple(new_notes))
-
+            clip.remove_notes_by_id(tuple(note.note_id for note in matches))
             logger.info("Cleared note at x=%s, y=%s", x, y)
 
         except Exception as e:
@@ -579,47 +697,28 @@ class ClipHandler(BaseHandler):
         if dx == 0 and dy == 0:
             return self.success()
 
-        if Live is None:
-            raise ValueError("Live API not available")
-
         try:
-            # Get all notes
-            notes = clip.get_notes(0.0, 0, clip.length, 128)
+            notes, matches = self._notes_at(clip, x, y)
 
-            # Find and move the target note
-            new_notes = []
-            moved = False
-            for note in notes:
-                pitch, time, duration, velocity, mute = note
-                new_time = float(time)
-                new_pitch = int(pitch)
-
-                # Check if this is the note to move
-                if abs(time - float(x)) < 0.001 and int(pitch) == int(y):
-                    new_time = float(time) + float(dx)
-                    new_pitch = int(pitch) + int(dy)
-                    moved = True
-
-                # Clamp pitch to valid range
-                if 0 <= new_pitch <= 127 and new_time >= 0:
-                    spec = Live.Clip.MidiNoteSpecification(
-                        start_time=new_time,
-                        duration=float(duration),
-                        pitch=new_pitch,
-                        velocity=float(velocity),
-                        mute=bool(mute)
-                    )
-                    new_notes.append(spec)
-
-            if not moved:
+            if not matches:
                 logger.warning("Note not found at x=%s, y=%s", x, y)
                 return self.success()
 
-            # Clear and rewrite
-            clip.remove_notes_extended(from_pitch=0, pitch_span=128,
-                                       from_time=0.0, time_span=clip.length)
-            if new_notes:
-                clip.add_new_notes(tuple(new_notes))
+            # Notes moved out of the valid pitch/time range are dropped
+            dropped = []
+            for note in matches:
+                new_time = float(note.start_time) + float(dx)
+                new_pitch = int(note.pitch) + int(dy)
+                if 0 <= new_pitch <= 127 and new_time >= 0:
+                    note.start_time = new_time
+                    note.pitch = new_pitch
+                else:
+                    dropped.append(note.note_id)
+
+            with self.undo_step():
+                clip.apply_note_modifications(notes)
+                if dropped:
+                    clip.remove_notes_by_id(tuple(dropped))
 
             logger.info("Moved note from x=%s, y=%s by dx=%s, dy=%s", x, y, dx, dy)
 
@@ -629,8 +728,16 @@ class ClipHandler(BaseHandler):
 
         return self.success()
 
-    def _modify_note_property(self, params, prop_name, prop_key):
-        """Helper to modify a single note property."""
+    def _modify_note_property(self, params, prop_key, attr, coerce):
+        """
+        Helper to modify a single note property.
+
+        Args:
+            params: Request params (x, y, and prop_key or value)
+            prop_key: Param name for the new value, also used in messages
+            attr: MidiNote attribute to set
+            coerce: Converts the param value to the attribute type
+        """
         clip = self._get_clip(params)
         x = params.get('x')
         y = params.get('y')
@@ -644,68 +751,39 @@ class ClipHandler(BaseHandler):
         if value is None:
             raise ValueError(f"{prop_key} or value is required")
 
-        if Live is None:
-            raise ValueError("Live API not available")
-
         try:
-            notes = clip.get_notes(0.0, 0, clip.length, 128)
+            notes, matches = self._notes_at(clip, x, y)
 
-            new_notes = []
-            modified = False
-            for note in notes:
-                pitch, time, duration, velocity, mute = note
-                new_velocity = float(velocity)
-                new_duration = float(duration)
-                new_mute = bool(mute)
-
-                if abs(time - float(x)) < 0.001 and int(pitch) == int(y):
-                    modified = True
-                    if prop_name == 'velocity':
-                        new_velocity = float(value)
-                    elif prop_name == 'duration':
-                        new_duration = float(value)
-                    elif prop_name == 'muted':
-                        new_mute = bool(value)
-
-                spec = Live.Clip.MidiNoteSpecification(
-                    start_time=float(time),
-                    duration=new_duration,
-                    pitch=int(pitch),
-                    velocity=new_velocity,
-                    mute=new_mute
-                )
-                new_notes.append(spec)
-
-            if not modified:
+            if not matches:
                 logger.warning("Note not found at x=%s, y=%s", x, y)
                 return self.success()
 
-            clip.remove_notes_extended(from_pitch=0, pitch_span=128,
-                                       from_time=0.0, time_span=clip.length)
-            if new_notes:
-                clip.add_new_notes(tuple(new_notes))
+            new_value = coerce(value)
+            for note in matches:
+                setattr(note, attr, new_value)
 
-            logger.info("Set note %s to %s at x=%s, y=%s", prop_name, value, x, y)
+            clip.apply_note_modifications(notes)
+            logger.info("Set note %s to %s at x=%s, y=%s", prop_key, value, x, y)
 
         except Exception as e:
-            logger.error("Error setting note %s: %s", prop_name, e)
+            logger.error("Error setting note %s: %s", prop_key, e)
             raise
 
         return self.success()
 
     def handle_setNoteVelocity(self, params):
         """Set velocity of a single note."""
-        return self._modify_note_property(params, 'velocity', 'velocity')
+        return self._modify_note_property(params, 'velocity', 'velocity', float)
 
     def handle_setNoteDuration(self, params):
         """Set duration of a single note."""
-        return self._modify_note_property(params, 'duration', 'duration')
+        return self._modify_note_property(params, 'duration', 'duration', float)
 
     def handle_setNoteMuted(self, params):
         """Set muted state of a single note."""
-        return self._modify_note_property(params, 'muted', 'muted')
+        return self._modify_note_property(params, 'muted', 'mute', bool)
 
-    def handle_getSceneCount(self, params):
+    def handle_getSceneCount(self):
         """Get the number of scenes in the project."""
         return {'sceneCount': len(self.song.scenes)}
 
@@ -713,12 +791,16 @@ class ClipHandler(BaseHandler):
         """Create new scene(s) at the end of the project."""
         count = params.get('count', 1)
 
+        song = self.song
+        start = len(song.scenes)
+
         try:
-            for _ in range(count):
-                # Live API: create_scene(index) - at end = len(scenes)
-                self.song.create_scene(len(self.song.scenes))
+            with self.undo_step():
+                for i in range(count):
+                    # Live API: create_scene(index) - at end = len(scenes)
+                    song.create_scene(start + i)
 
-            logger.info("Created %d scene(s), total now: %d", count, len(self.song.scenes))
+            logger.info("Created %d scene(s), total now: %d", count, start + count)
 
         except Exception as e:
             logger.error("Error creating scene: %s", e)
@@ -727,5 +809,5 @@ class ClipHandler(BaseHandler):
         return {
             'success': True,
             'created': count,
-            'sceneCount': len(self.song.scenes)
+            'sceneCount': start + count
         }
@@ -3,11 +3,16 @@
 
 from __future__ import absolute_import, print_function
 import logging
+from operator import attrgetter
 
 from .base import BaseHandler
 
 logger = logging.getLogger("ableton_mcp")
 
+# Song properties read by getInfo, fetched in one attrgetter call
+_INFO_ATTRS = attrgetter('tempo', 'signature_numerator', 'signature_denominator',
+                         'is_playing', 'record_mode')
+
 
 class ProjectHandler(BaseHandler):
     """
@@ -17,13 +22,15 @@ class ProjectHandler(BaseHandler):
         - getInfo: Get BPM, time signature, playback state
     """
 
-    def handle_getInfo(self, params):
+    __slots__ = ()
+
+    def handle_getInfo(self):
         """Get current project information."""
-        song = self.song
+        tempo, numerator, denominator, is_playing, record_mode = _INFO_ATTRS(self.song)
         return {
-            'bpm': song.tempo,
-            'timeSignatureNumerator': song.signature_numerator,
-            'timeSignatureDenominator': song.signature_denominator,
-            'isPlaying': song.is_playing,
-            'isRecording': song.record_mode,
+            'bpm': tempo,
+            'timeSignatureNumerator': numerator,
+            'timeSignatureDenominator': denominator,
+            'isPlaying': is_playing,
+            'isRecording': record_mode,
         }
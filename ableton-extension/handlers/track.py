@@ -8,6 +8,21 @@ from .base import BaseHandler
 
 logger = logging.getLogger("ableton_mcp")
 
+# param name -> (track attribute, coerce, default) for the plain setters
+_SETTERS = {
+    'name': ('name', str, ''),
+    'mute': ('mute', bool, False),
+    'solo': ('solo', bool, False),
+}
+
+
+def _require(params, key):
+    """Get a required parameter, raising ValueError if it is missing."""
+    value = params.get(key)
+    if value is None:
+        raise ValueError("%s is required" % key)
+    return value
+
 
 class TrackHandler(BaseHandler):
     """
@@ -23,10 +38,44 @@ class TrackHandler(BaseHandler):
         - setSolo: Set track solo state
     """
 
+    __slots__ = ('_tracks', '_tracks_listener')
+
+    def __init__(self, dispatcher):
+        super(TrackHandler, self).__init__(dispatcher)
+        # Snapshot of song.tracks, see _tracks_list
+        self._tracks = None
+        self._tracks_listener = False
+
+    def disconnect(self):
+        """Remove the track list listener."""
+        self._tracks = None
+        if self._tracks_listener:
+            try:
+                self.song.remove_tracks_listener(self._invalidate_tracks)
+            except Exception as e:
+                logger.warning("Error removing tracks listener: %s", e)
+            self._tracks_listener = False
+
+    def _invalidate_tracks(self):
+        """Drop the track snapshot. Listener for track list changes."""
+        self._tracks = None
+
+    def _tracks_list(self):
+        """Get the song's tracks, cached until the track list changes."""
+        tracks = self._tracks
+        if tracks is None:
+            if not self._tracks_listener:
+                self.song.add_tracks_listener(self._invalidate_tracks)
+                self._tracks_listener = True
+            tracks = self._tracks = list(self.song.tracks)
+        return tracks
+
     def handle_list(self, params):
         """List all tracks with their properties."""
         tracks = []
+        append = tracks.append
 
+        # Each attribute read crosses into Live, so read each one once
         for i, track in enumerate(self.song.tracks):
             try:
                 track_info = {
@@ -34,21 +83,24 @@ class TrackHandler(BaseHandler):
                     'name': track.name,
                     'mute': track.mute,
                     'solo': track.solo,
-                    'arm': track.arm if hasattr(track, 'arm') else False,
+                    'arm': getattr(track, 'arm', False),
                 }
 
                 # Mixer device properties (volume, pan)
-                if track.mixer_device:
-                    mixer = track.mixer_device
-                    track_info['volume'] = mixer.volume.value if mixer.volume else 0.85
-                    track_info['pan'] = mixer.panning.value if mixer.panning else 0.0
-
-                tracks.append(track_info)
+                mixer = track.mixer_device
+                if mixer:
+                    volume = mixer.volume
+                    panning = mixer.panning
+                    track_info['volume'] = volume.value if volume else 0.85
+                    track_info['pan'] = panning.value if panning else 0.0
+
+                append(track_info)
             except Exception as e:
                 logger.warning("Error reading track %d: %s", i, e)
                 continue
 
-        logger.info("Listed %d tracks", len(tracks))
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Listed %d tracks", len(tracks))
         return {'tracks': tracks}
 
     def handle_create(self, params):
@@ -58,7 +110,7 @@ class TrackHandler(BaseHandler):
 
         try:
             if position == -1:
-                position = len(list(self.song.tracks))
+                position = len(self.song.tracks)
 
             if track_type == 'audio':
                 self.song.create_audio_track(position)
@@ -66,7 +118,8 @@ class TrackHandler(BaseHandler):
                 # 'instrument' and 'effect' both create MIDI tracks
                 self.song.create_midi_track(position)
 
-            logger.info("Created %s track at position %d", track_type, position)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Created %s track at position %d", track_type, position)
             return {'index': position}
 
         except Exception as e:
@@ -75,15 +128,13 @@ class TrackHandler(BaseHandler):
 
     def handle_delete(self, params):
         """Delete a track by index."""
-        index = params.get('index')
-
-        if index is None:
-            raise ValueError("index is required")
+        index = _require(params, 'index')
 
         try:
-            track = self.song.tracks[index]
+            track = self._tracks_list()[index]
             self.song.delete_track(index)
-            logger.info("Deleted track at index %d", index)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Deleted track at index %d", index)
 
         except Exception as e:
             logger.error("Error deleting track: %s", e)
@@ -91,38 +142,39 @@ class TrackHandler(BaseHandler):
 
         return self.success()
 
-    def handle_setName(self, params):
-        """Set track name."""
-        index = params.get('index')
-        name = params.get('name', '')
-
-        if index is None:
-            raise ValueError("index is required")
+    def _set_track_attr(self, params, key):
+        """Set a plain track property described by _SETTERS."""
+        index = _require(params, 'index')
+        attr, coerce, default = _SETTERS[key]
+        value = coerce(params.get(key, default))
 
         try:
-            track = self.song.tracks[index]
-            track.name = name
-            logger.info("Set track %d name to '%s'", index, name)
+            track = self._tracks_list()[index]
+            setattr(track, attr, value)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Set track %d %s to %r", index, key, value)
 
         except Exception as e:
-            logger.error("Error setting track name: %s", e)
+            logger.error("Error setting track %s: %s", key, e)
             raise
 
         return self.success()
 
+    def handle_setName(self, params):
+        """Set track name."""
+        return self._set_track_attr(params, 'name')
+
     def handle_setVolume(self, params):
         """Set track volume (0.0 to 1.0)."""
-        index = params.get('index')
+        index = _require(params, 'index')
         volume = params.get('volume', 0.85)
 
-        if index is None:
-            raise ValueError("index is required")
-
         try:
-            track = self.song.tracks[index]
+            track = self._tracks_list()[index]
             if track.mixer_device and track.mixer_device.volume:
                 track.mixer_device.volume.value = float(volume)
-                logger.info("Set track %d volume to %s", index, volume)
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("Set track %d volume to %s", index, volume)
             else:
                 raise ValueError("Track has no mixer device")
 
@@ -134,38 +186,8 @@ class TrackHandler(BaseHandler):
 
     def handle_setMute(self, params):
         """Set track mute state."""
-        index = params.get('index')
-        mute = params.get('mute', False)
-
-        if index is None:
-            raise ValueError("index is required")
-
-        try:
-            track = self.song.tracks[index]
-            track.mute = bool(mute)
-            logger.info("Set track %d mute to %s", index, mute)
-
-        except Exception as e:
-            logger.error("Error setting track mute: %s", e)
-            raise
-
-        return self.success()
+        return self._set_track_attr(params, 'mute')
 
     def handle_setSolo(self, params):
         """Set track solo state."""
-        index = params.get('index')
-        solo = params.get('solo', False)
-
-        if index is None:
-            raise ValueError("index is required")
-
-        try:
-            track = self.song.tracks[index]
-            track.solo = bool(solo)
-            logger.info("Set track %d solo to %s", index, solo)
-
-        except Exception as e:
-            logger.error("Error setting track solo: %s", e)
-            raise
-
-        return self.success()
+        return self._set_track_attr(params, 'solo')
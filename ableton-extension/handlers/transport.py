@@ -17,12 +17,21 @@ class TransportHandler(BaseHandler):
         - setPosition: Set playback position in beats
     """
 
+    __slots__ = ()
+
     def handle_setPosition(self, params):
         """Set playback position in beats."""
         beats = params.get('beats')
         if beats is None:
             raise ValueError("Missing required parameter: beats")
 
-        self.song.current_song_time = float(beats)
-        logger.info("Set position to %s beats", beats)
+        beats = float(beats)
+        song = self.song
+        # Compare against Live's own value rather than the last value we
+        # wrote: playback and the user move the playhead too. Reading is
+        # far cheaper than a write that relocates the playhead.
+        if song.current_song_time != beats:
+            song.current_song_time = beats
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Set position to %s beats", beats)
         return self.success()
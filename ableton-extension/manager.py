@@ -49,7 +49,8 @@ class AbletonMCP(ControlSurface):
             self._tcp_server.set_handler(self._dispatcher.dispatch)
 
             # Start the tick scheduler
-            self._schedule_tick()
+            # delay=1 means next tick (~100ms in Live's scheduler)
+            self.schedule_message(1, self._tick)
 
             # Show success message
             self.show_message("Ableton MCP started on port 8182")
@@ -59,27 +60,18 @@ class AbletonMCP(ControlSurface):
             logger.error("Failed to initialize Ableton MCP: %s", e)
             self.show_message("Ableton MCP failed to start: " + str(e))
 
-    def _schedule_tick(self):
-        """Schedule the next tick."""
-        # schedule_message(delay, callback)
-        # delay=1 means next tick (~100ms in Live's scheduler)
-        self.schedule_message(1, self._tick)
-
     def _tick(self):
         """
-        Called every ~100ms to process TCP messages.
+        Called every ~100ms (backing off while idle, see
+        TCPServer.process) to process TCP messages.
 
         This is the cooperative multitasking pattern required by
         Live's Python environment which doesn't support threading.
         """
-        try:
-            if self._tcp_server:
-                self._tcp_server.process()
-        except Exception as e:
-            logger.error("Tick error: %s", e)
-
-        # Reschedule for next tick
-        self._schedule_tick()
+        # process() handles its own errors and returns the next delay,
+        # so the tick chain always continues
+        delay = self._tcp_server.process() if self._tcp_server else 1
+        self.schedule_message(delay, self._tick)
 
     def song(self):
         """Get the current song (Live Set)."""
@@ -93,5 +85,9 @@ class AbletonMCP(ControlSurface):
             self._tcp_server.shutdown()
             self._tcp_server = None
 
+        if self._dispatcher:
+            self._dispatcher.disconnect()
+            self._dispatcher = None
+
         self.show_message("Ableton MCP disconnected")
         super(AbletonMCP, self).disconnect()
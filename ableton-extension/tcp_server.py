@@ -3,14 +3,62 @@
 
 from __future__ import absolute_import, print_function
 import socket
+import selectors
 import errno
 import json
 import logging
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Not bundled with Live's Python; fall back to stdlib json
+
 logger = logging.getLogger("ableton_mcp")
 
 DEFAULT_PORT = 8182
 
+# Idle polling backoff: the poll delay grows by one scheduler tick for
+# every IDLE_POLLS_PER_STEP empty polls, up to MAX_IDLE_DELAY ticks.
+IDLE_POLLS_PER_STEP = 4
+MAX_IDLE_DELAY = 3
+
+# Upper bound on bytes read from one client per tick
+MAX_READ_PER_TICK = 1024 * 1024
+
+# Per-client cap on both an unterminated request line and unread
+# responses; a client over it is disconnected rather than letting the
+# buffer grow inside Live
+MAX_BUFFER_BYTES = 4 * 1024 * 1024
+
+# Kernel send buffer for clients, large enough for typical note dumps
+CLIENT_SNDBUF = 256 * 1024
+
+if orjson is not None:
+    _json_loads = orjson.loads
+
+    def _encode_response(response):
+        """Serialize a response to a newline-terminated UTF-8 frame."""
+        return orjson.dumps(response) + b'\n'
+else:
+    # Bound once: json.dumps() builds a fresh encoder whenever separators
+    # are passed, and the compact separators trim every response frame
+    _json_decode = json.JSONDecoder().decode
+    _json_encode = json.JSONEncoder(separators=(',', ':')).encode
+
+    def _json_loads(line):
+        """Parse one UTF-8 encoded JSON line."""
+        return _json_decode(line.decode('utf-8'))
+
+    def _encode_response(response):
+        """Serialize a response to a newline-terminated UTF-8 frame."""
+        return (_json_encode(response) + '\n').encode('utf-8')
+
+# Error envelopes whose shape never changes, built once. A parse error
+# frame only needs its JSON-encoded message filled in.
+_PARSE_ERROR_FRAME = b'{"jsonrpc":"2.0","id":null,"error":{"code":-32700,"message":%s}}\n'
+_NO_HANDLER_ERROR = {"code": -32603, "message": "No handler configured"}
+_INVALID_REQUEST_ERROR = {"code": -32600, "message": "Invalid Request: expected a JSON object"}
+
 
 class TCPServer:
     """
@@ -18,16 +66,23 @@ class TCPServer:
 
     Designed to work within Ableton Live's Python environment which
     doesn't support threading. Uses non-blocking sockets polled via
-    the ControlSurface's schedule_message() tick.
+    the ControlSurface's schedule_message() tick; a zero-timeout
+    selector limits each tick to the sockets that are actually ready.
     """
 
     def __init__(self, port=DEFAULT_PORT):
         self._port = port
         self._handler = None
         self._socket = None
-        self._clients = []
-        self._buffers = {}  # Per-client receive buffers
+        self._selector = None
+        self._clients = set()
+        self._buffers = {}  # Per-client receive buffers (bytearray)
+        self._outbox = {}  # Per-client unsent response bytes (bytearray)
+        # Scratch space for recv_into, shared by all clients (single-threaded)
+        self._recv_buf = bytearray(65536)
+        self._recv_view = memoryview(self._recv_buf)
         self._running = False
+        self._idle_polls = 0
 
         self._init_socket()
 
@@ -39,6 +94,9 @@ class TCPServer:
             self._socket.setblocking(0)
             self._socket.bind(('127.0.0.1', self._port))
             self._socket.listen(5)
+            # Each registration's data is the callback for its ready events
+            self._selector = selectors.DefaultSelector()
+            self._selector.register(self._socket, selectors.EVENT_READ, self._accept_connections)
             self._running = True
             logger.info("TCP server listening on port %d", self._port)
         except socket.error as e:
@@ -57,92 +115,180 @@ class TCPServer:
         Process pending connections and messages.
 
         Called each tick (~100ms) from the ControlSurface.
-        Non-blocking - returns immediately if no work to do.
-        """
-        if not self._running:
-            return
-
-        self._accept_connections()
-        self._read_messages()
+        Non-blocking - returns immediately if no work to do. Never
+        raises, so the caller's tick chain cannot be broken; an error
+        is logged and only affects the socket that caused it.
 
-    def _accept_connections(self):
-        """Accept any pending connections (non-blocking)."""
+        Returns:
+            Scheduler ticks to wait before the next call: 1 after any
+            socket was ready, growing to MAX_IDLE_DELAY while idle
+        """
+        if self._running:
+            try:
+                ready = self._selector.select(timeout=0)
+            except Exception as e:
+                logger.error("Select error: %s", e)
+                ready = ()
+
+            for key, events in ready:
+                try:
+                    key.data(key.fileobj, events)
+                except Exception as e:
+                    logger.error("Socket error: %s", e)
+
+            if ready:
+                self._idle_polls = 0
+                return 1
+
+        self._idle_polls += 1
+        return min(MAX_IDLE_DELAY, 1 + self._idle_polls // IDLE_POLLS_PER_STEP)
+
+    def _accept_connections(self, server_socket, events):
+        """Accept a pending connection (non-blocking)."""
         try:
-            client_socket, addr = self._socket.accept()
+            client_socket, addr = server_socket.accept()
             client_socket.setblocking(0)
-            self._clients.append(client_socket)
-            self._buffers[client_socket] = ""
+            # Replies are small, single writes: don't let Nagle hold them
+            client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            try:
+                client_socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, CLIENT_SNDBUF)
+            except socket.error:
+                pass  # Keep the OS default
+            self._clients.add(client_socket)
+            self._buffers[client_socket] = bytearray()
+            self._outbox[client_socket] = bytearray()
+            self._selector.register(client_socket, selectors.EVENT_READ, self._service_client)
             logger.info("Client connected from %s", addr)
         except socket.error as e:
             if e.errno not in (errno.EAGAIN, errno.EWOULDBLOCK):
                 logger.error("Accept error: %s", e)
 
-    def _read_messages(self):
-        """Read and process messages from all connected clients."""
-        for client in self._clients[:]:  # Copy list to allow removal during iteration
-            try:
-                data = client.recv(65536)
-                if not data:
-                    # Client disconnected
-                    self._remove_client(client)
-                    continue
+    def _service_client(self, client, events):
+        """Handle selector events for a connected client."""
+        if events & selectors.EVENT_WRITE:
+            self._write_client(client)
+        if events & selectors.EVENT_READ:
+            self._read_client(client)
 
-                # Append to buffer
-                self._buffers[client] += data.decode('utf-8')
+    def _read_client(self, client):
+        """Read everything a readable client has queued, then process it.
 
-                # Process complete messages (newline-delimited)
-                self._process_buffer(client)
+        Keeps reading until the socket is drained, so a request spread
+        over several TCP segments is handled in this tick rather than
+        over several ticks. Reads stop after MAX_READ_PER_TICK bytes.
+        """
+        buffer = self._buffers.get(client)
+        if buffer is None:
+            # Removed earlier in this tick
+            return
 
-            except socket.error as e:
-                if e.errno in (errno.EAGAIN, errno.EWOULDBLOCK):
-                    # No data available - normal for non-blocking
-                    continue
-                elif e.errno == errno.ECONNRESET:
+        recv_buf = self._recv_buf
+        total = 0
+        closed = False
+        try:
+            while total < MAX_READ_PER_TICK:
+                received = client.recv_into(recv_buf)
+                if not received:
+                    closed = True
+                    break
+
+                # Append raw bytes; only complete lines get decoded
+                buffer += self._recv_view[:received]
+                total += received
+                if received < len(recv_buf):
+                    # Short read: nothing more queued right now
+                    break
+
+        except socket.error as e:
+            if e.errno not in (errno.EAGAIN, errno.EWOULDBLOCK):
+                if e.errno == errno.ECONNRESET:
                     logger.info("Client connection reset")
-                    self._remove_client(client)
                 else:
                     logger.error("Read error: %s", e)
-                    self._remove_client(client)
+                self._remove_client(client)
+                return
+            # Otherwise drained (or spurious readiness) - normal for non-blocking
+
+        # Process complete messages (newline-delimited)
+        self._process_buffer(client)
+
+        if client not in self._buffers:
+            # Dropped by a failed send or a full outbox
+            return
+        if closed:
+            # Client disconnected
+            self._remove_client(client)
+        elif len(buffer) > MAX_BUFFER_BYTES:
+            logger.warning("Client sent %d bytes without a newline, disconnecting", len(buffer))
+            self._remove_client(client)
 
     def _process_buffer(self, client):
-        """Process complete JSON-RPC messages from client buffer."""
+        """Process complete JSON-RPC messages from client buffer.
+
+        Responses are queued in the outbox and written together once all
+        complete lines are handled, so pipelined requests cost a single
+        send() rather than one per response. Stops and disconnects the
+        client once more than MAX_BUFFER_BYTES of responses are left
+        unsent.
+        """
         buffer = self._buffers[client]
+        outbox = self._outbox[client]
+        overflow = False
+
+        try:
+            while True:
+                end = buffer.find(b'\n')
+                if end < 0:
+                    break
+
+                if len(outbox) > MAX_BUFFER_BYTES:
+                    # Give the socket a chance before deciding the client is stuck
+                    self._write_client(client)
+                    if len(outbox) > MAX_BUFFER_BYTES:
+                        overflow = True
+                        break
+                line = buffer[:end]  # Both decoders accept a bytearray
+                del buffer[:end + 1]
+
+                if not line or line.isspace():
+                    # Blank keep-alive line
+                    continue
 
-        while '\n' in buffer:
-            line, buffer = buffer.split('\n', 1)
-            self._buffers[client] = buffer
+                try:
+                    request = _json_loads(line)
+                except ValueError as e:  # JSONDecodeError or invalid UTF-8
+                    logger.error("JSON parse error: %s", e)
+                    message = json.dumps("Parse error: " + str(e)).encode('utf-8')
+                    outbox += _PARSE_ERROR_FRAME % message
+                    continue
 
-            if not line.strip():
-                continue
+                outbox += _encode_response(self._handle_request(request))
+        finally:
+            # Flush whatever was queued, even if a line above raised
+            if outbox:
+                self._write_client(client)
 
-            try:
-                request = json.loads(line)
-                response = self._handle_request(request)
-                self._send_response(client, response)
-            except json.JSONDecodeError as e:
-                logger.error("JSON parse error: %s", e)
-                error_response = {
-                    "jsonrpc": "2.0",
-                    "id": None,
-                    "error": {
-                        "code": -32700,
-                        "message": "Parse error: " + str(e)
-                    }
-                }
-                self._send_response(client, error_response)
+        if overflow and client in self._buffers:
+            logger.warning("Client not reading responses (%d bytes queued), disconnecting", len(outbox))
+            self._remove_client(client)
 
     def _handle_request(self, request):
         """Handle a JSON-RPC request and return response."""
+        if not isinstance(request, dict):
+            # Valid JSON but not a request object (batches are not supported)
+            return {
+                "jsonrpc": "2.0",
+                "id": None,
+                "error": _INVALID_REQUEST_ERROR
+            }
+
         request_id = request.get('id')
 
         if not self._handler:
             return {
                 "jsonrpc": "2.0",
                 "id": request_id,
-                "error": {
-                    "code": -32603,
-                    "message": "No handler configured"
-                }
+                "error": _NO_HANDLER_ERROR
             }
 
         try:
@@ -158,24 +304,44 @@ class TCPServer:
                 }
             }
 
-    def _send_response(self, client, response):
-        """Send JSON-RPC response to client."""
+    def _write_client(self, client):
+        """Send as much queued output as the socket accepts without blocking.
+
+        Watches the client for EVENT_WRITE while output remains, so a
+        slow reader never stalls the tick inside sendall().
+        """
+        outbox = self._outbox.get(client)
+        if not outbox:
+            return
+
         try:
-            data = json.dumps(response) + '\n'
-            client.sendall(data.encode('utf-8'))
+            sent = client.send(outbox)
         except socket.error as e:
-            logger.error("Send error: %s", e)
-            self._remove_client(client)
+            if e.errno not in (errno.EAGAIN, errno.EWOULDBLOCK):
+                logger.error("Send error: %s", e)
+                self._remove_client(client)
+                return
+            sent = 0
+        del outbox[:sent]
+
+        events = selectors.EVENT_READ
+        if outbox:
+            events |= selectors.EVENT_WRITE
+        if self._selector.get_key(client).events != events:
+            self._selector.modify(client, events, self._service_client)
 
     def _remove_client(self, client):
         """Clean up a disconnected client."""
-        if client in self._clients:
-            self._clients.remove(client)
-        if client in self._buffers:
-            del self._buffers[client]
+        self._clients.discard(client)
+        self._buffers.pop(client, None)
+        self._outbox.pop(client, None)
+        try:
+            self._selector.unregister(client)
+        except (KeyError, ValueError):
+            pass  # Never registered, or already closed
         try:
             client.close()
-        except:
+        except socket.error:
             pass
         logger.info("Client disconnected")
 
@@ -183,9 +349,13 @@ class TCPServer:
         """Shut down the server and all client connections."""
         self._running = False
 
-        for client in self._clients[:]:
+        for client in list(self._clients):
             self._remove_client(client)
 
+        if self._selector:
+            self._selector.close()
+            self._selector = None
+
         if self._socket:
             try:
                 self._socket.close()
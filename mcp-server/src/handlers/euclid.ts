@@ -54,8 +54,13 @@ export async function handleBatchCreateEuclidPattern(ctx: HandlerContext): Promi
 
           // Smart clearing: only clear notes at pitches we're about to pattern
           const pitchesToClear = [...new Set(clipInput.patterns.map(p => p.pitch))];
-          for (const pitch of pitchesToClear) {
-            await dawManager.send('clip.clearNotesAtPitch', { pitch }, daw);
+          if (daw === 'ableton') {
+            // Ableton clears all pitches in one request
+            await dawManager.send('clip.clearNotesAtPitches', { pitches: pitchesToClear }, daw);
+          } else {
+            for (const pitch of pitchesToClear) {
+              await dawManager.send('clip.clearNotesAtPitch', { pitch }, daw);
+            }
           }
         } else {
           // Scenario 1: Create new clip